@@ -0,0 +1,74 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+ADIFPUSH - compiled ADIF parser (optional)
+Drop-in replacement for AdifParser.parse_line
+Build with: cythonize -i adifparse.pyx
+"""
+
+from libc.string cimport memchr
+
+
+cdef inline bint _is_word(unsigned char c):
+    return (c'a' <= c <= c'z') or (c'A' <= c <= c'Z') or (c'0' <= c <= c'9') or c == c'_'
+
+
+cdef inline bint _is_digit(unsigned char c):
+    return c'0' <= c <= c'9'
+
+
+cdef bint _match_tag(const unsigned char* s, Py_ssize_t n, Py_ssize_t lt,
+                     Py_ssize_t* key_end, Py_ssize_t* value_start, Py_ssize_t* value_end):
+    """Match <KEY:LENGTH>VALUE at s[lt] (same as regex <(\\w+):(\\d+)>([^<]*))"""
+    cdef Py_ssize_t i = lt + 1
+    cdef Py_ssize_t start
+
+    while i < n and _is_word(s[i]):
+        i += 1
+    if i == lt + 1 or i >= n or s[i] != c':':
+        return False
+    key_end[0] = i
+
+    i += 1
+    start = i
+    while i < n and _is_digit(s[i]):
+        i += 1
+    if i == start or i >= n or s[i] != c'>':
+        return False
+
+    i += 1
+    value_start[0] = i
+    while i < n and s[i] != c'<':
+        i += 1
+    value_end[0] = i
+    return True
+
+
+cdef Py_ssize_t _next_tag(const unsigned char* s, Py_ssize_t n, Py_ssize_t i):
+    cdef const unsigned char* lt = <const unsigned char*>memchr(s + i, c'<', n - i)
+    return -1 if lt == NULL else lt - s
+
+
+def parse_line(bytes line):
+    """Parse single ADIF line into dictionary (lowercase bytes keys, raw bytes values)"""
+    cdef const unsigned char* s = line
+    cdef Py_ssize_t n = len(line)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t key_end, value_start, value_end
+    cdef dict record = {}
+
+    while i < n:
+        i = _next_tag(s, n, i)
+        if i == -1:
+            break
+        if _match_tag(s, n, i, &key_end, &value_start, &value_end):
+            record[line[i + 1:key_end].lower()] = line[value_start:value_end]
+            i = value_end
+        else:
+            i += 1
+
+    # Validate essential fields
+    if b'call' not in record or b'qso_date' not in record or b'time_on' not in record:
+        return None
+
+    return record
+
@@ -7,18 +7,60 @@ Replaces .NET Core 3.1 version with zero compilation hassles
 
 import sys
 import os
+import asyncio
+import atexit
 import json
+import mmap
+import queue
+import signal
 import socket
 import struct
+import threading
 import time
 import re
 import hashlib
+import binascii
+import io
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Set
 from datetime import datetime
 from urllib.parse import urljoin
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from requests.utils import get_environ_proxies, select_proxy
+from urllib3.util.retry import Retry
+
+try:
+    import httpx  # Optional: concurrent HTTP/2 uploads in push_file
+except ImportError:
+    httpx = None
+HTTP2_AVAILABLE = find_spec('h2') is not None
+
+try:
+    import orjson  # Optional: faster JSON string escaping for payloads
+    _json_string = orjson.dumps
+except ImportError:
+    def _json_string(value: str) -> bytes:
+        return json.dumps(value).encode()
+
+try:
+    from pybloom_live import ScalableBloomFilter  # Optional: constant-memory duplicate cache
+except ImportError:
+    ScalableBloomFilter = None
+
+try:
+    import adifparse as _adifparse  # Optional: compiled parser (cythonize -i adifparse.pyx)
+except ImportError:
+    _adifparse = None
+
+
+# ADIF tag: <KEY:LENGTH>VALUE
+_ADIF_TAG_RE = re.compile(rb'<(\w+):(\d+)>([^<]*)', re.IGNORECASE)
 
 
 class Config:
@@ -26,7 +68,18 @@ class Config:
     
     CONFIG_DIR = Path.home() / ".adifpush"
     CONFIG_FILE = CONFIG_DIR / "cloudlog"
-    CACHE_FILE = CONFIG_DIR / "uploaded_qsos"  # Track uploaded QSOs
+    CACHE_FILE = CONFIG_DIR / "uploaded_qsos.bin"  # Track uploaded QSOs (8-byte digests)
+    LEGACY_CACHE_FILE = CONFIG_DIR / "uploaded_qsos"  # Text cache of older versions
+    BLOOM_FILE = CONFIG_DIR / "uploaded_qsos.bloom"  # Saved ScalableBloomFilter of CACHE_FILE
+    CACHE_FLUSH_INTERVAL = 30  # Seconds between writes of new hashes to CACHE_FILE
+    BLOOM_HEADER = struct.Struct('<Q')  # Length of CACHE_FILE covered by BLOOM_FILE
+    
+    _in_memory_cache: Optional['QsoCache'] = None  # Source of truth once loaded
+    _legacy_hashes: Set[bytes] = set()  # SHA256 digests of LEGACY_CACHE_FILE, checked on a miss
+    _pending: List[bytes] = []  # Hashes not yet written to CACHE_FILE
+    _cache_size = 0  # Bytes of CACHE_FILE read into _in_memory_cache
+    _dirty = False
+    _last_flush = 0.0
     
     @staticmethod
     def ensure_dir():
@@ -72,209 +125,629 @@ class Config:
         return log_file
     
     @staticmethod
-    def load_uploaded_qsos() -> Set[str]:
-        """Load set of already uploaded QSO hashes"""
+    def load_uploaded_qsos() -> 'QsoCache':
+        """Get set of already uploaded QSO hashes (shared, loaded from disk once)"""
+        if Config._in_memory_cache is None:
+            Config._in_memory_cache = Config._read_cache_file()
+            Config._last_flush = time.monotonic()
+        return Config._in_memory_cache
+    
+    @staticmethod
+    def _read_cache_file() -> 'QsoCache':
+        """Read uploaded QSO hashes from cache file (fixed-width raw digests)"""
         Config.ensure_dir()
-        if not Config.CACHE_FILE.exists():
-            return set()
+        digest_size = AdifParser.DIGEST_SIZE
+        
+        # The legacy file is only read, so the SHA256 digests stay usable by older versions
+        legacy = Config._read_legacy_cache_file()
+        Config._legacy_hashes = {h for h in legacy if len(h) == hashlib.sha256().digest_size}
+        legacy_digests = [h for h in legacy if len(h) == digest_size]
         
         try:
-            return set(Config.CACHE_FILE.read_text().strip().split('\n'))
-        except:
+            size = Config.CACHE_FILE.stat().st_size
+            # Drop trailing partial digest left by an interrupted write
+            if size % digest_size:
+                size -= size % digest_size
+                os.truncate(Config.CACHE_FILE, size)
+        except OSError:
+            size = 0
+        
+        Config._cache_size = size
+        bloom, covered = Config._load_bloom_file(size)
+        if bloom is not None:
+            uploaded = QsoCache(bloom)
+            if covered < size:
+                # Digests appended by another instance after it saved the bloom filter
+                uploaded.update(Config._iter_digests(covered, size))
+                Config._save_bloom_file(bloom, size)
+            uploaded.update(legacy_digests)
+            return uploaded
+        
+        uploaded = QsoCache()
+        uploaded.update(Config._iter_digests(0, size))
+        
+        if uploaded.bloom is not None:
+            Config._save_bloom_file(uploaded.bloom, size)
+        # The cache is append-only, so compact (dedupe) once it has grown to more than
+        # twice the number of unique hashes
+        elif size > 2 * digest_size * len(uploaded):
+            Config.compact_cache(uploaded.exact)
+        uploaded.update(legacy_digests)
+        return uploaded
+    
+    @staticmethod
+    def _iter_digests(start: int, end: int) -> Iterator[bytes]:
+        """Yield raw digests stored in cache file between byte offsets start and end"""
+        digest_size = AdifParser.DIGEST_SIZE
+        if start >= end:
+            return  # Nothing to read (empty files can't be mapped)
+        try:
+            with open(Config.CACHE_FILE, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = min(end, len(mm) - len(mm) % digest_size)
+                for i in range(start, end, digest_size):
+                    yield mm[i:i + digest_size]
+        except (OSError, ValueError):
+            pass
+    
+    @staticmethod
+    def _load_bloom_file(size: int):
+        """Load bloom filter saved by flush_cache and the cache file length it covers"""
+        if ScalableBloomFilter is None:
+            return None, 0
+        try:
+            with open(Config.BLOOM_FILE, 'rb') as f:
+                (covered,) = Config.BLOOM_HEADER.unpack(f.read(Config.BLOOM_HEADER.size))
+                if covered > size:
+                    return None, 0  # Cache file was compacted or cleared since, rebuild
+                return ScalableBloomFilter.fromfile(f), covered
+        except Exception:
+            return None, 0
+    
+    @staticmethod
+    def _save_bloom_file(bloom, covered: int):
+        """Persist bloom filter next to cache file, covering its first `covered` bytes"""
+        buffer = io.BytesIO()
+        buffer.write(Config.BLOOM_HEADER.pack(covered))
+        bloom.tofile(buffer)
+        try:
+            Config._replace_file(Config.BLOOM_FILE, buffer.getvalue())
+        except OSError:
+            pass  # Only a shortcut, rebuilt or extended from cache file on next load
+    
+    @staticmethod
+    def _replace_file(path: Path, data: bytes):
+        """Atomically replace file contents via a temp file unique to this writer"""
+        fd, tmp_name = tempfile.mkstemp(dir=Config.CONFIG_DIR, prefix=path.name + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    
+    @staticmethod
+    def _read_legacy_cache_file() -> Set[bytes]:
+        """Read raw digests from text cache file of older versions (one hex digest per line)"""
+        try:
+            entries = Config.LEGACY_CACHE_FILE.read_bytes().split(b'\n')
+        except OSError:
             return set()
+        
+        # SHA256 (original version) or BLAKE2b hex digests
+        uploaded = set()
+        for entry in entries:
+            entry = entry.strip()
+            if len(entry) in (hashlib.sha256().digest_size * 2, AdifParser.DIGEST_SIZE * 2):
+                try:
+                    uploaded.add(binascii.unhexlify(entry))
+                except binascii.Error:
+                    pass
+        return uploaded
+    
+    @staticmethod
+    def compact_cache(uploaded: Set[bytes]):
+        """Rewrite cache file with each unique hash once"""
+        Config.ensure_dir()
+        Config._replace_file(Config.CACHE_FILE, b''.join(uploaded))
+        Config._cache_size = len(uploaded) * AdifParser.DIGEST_SIZE
     
     @staticmethod
-    def save_uploaded_qso(qso_hash: str):
-        """Add QSO hash to uploaded list"""
+    def open_cache_appender() -> int:
+        """Open cache file for appending raw QSO digests, returning file descriptor"""
         Config.ensure_dir()
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        return os.open(Config.CACHE_FILE, flags, 0o644)
+    
+    @staticmethod
+    def _append_to_cache(digests: bytes) -> int:
+        """Append raw QSO digests to cache file, returning its length after the write"""
+        fd = Config.open_cache_appender()
+        try:
+            os.write(fd, digests)
+            return os.lseek(fd, 0, os.SEEK_CUR)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def is_uploaded(qso_hash: bytes, record: Dict[bytes, bytes]) -> bool:
+        """Check whether QSO was uploaded, also by SHA256 hash of the original version"""
+        if qso_hash in Config.load_uploaded_qsos():
+            return True
+        if Config._legacy_hashes and AdifParser.legacy_hash(record) in Config._legacy_hashes:
+            Config.save_uploaded_qso(qso_hash)  # Found by BLAKE2b digest from now on
+            return True
+        return False
+    
+    @staticmethod
+    def save_uploaded_qso(qso_hash: bytes):
+        """Add QSO hash to uploaded list (written to disk by flush_cache)"""
         uploaded = Config.load_uploaded_qsos()
+        if qso_hash in uploaded:
+            return
         uploaded.add(qso_hash)
-        Config.CACHE_FILE.write_text('\n'.join(sorted(uploaded)))
+        Config._pending.append(qso_hash)
+        Config._dirty = True
+        
+        if time.monotonic() - Config._last_flush >= Config.CACHE_FLUSH_INTERVAL:
+            Config.flush_cache()
+    
+    @staticmethod
+    def flush_cache():
+        """Append hashes added since last flush to cache file"""
+        Config._last_flush = time.monotonic()
+        if not Config._dirty:
+            return
+        uploaded = Config._in_memory_cache
+        digests = b''.join(Config._pending)
+        end = Config._append_to_cache(digests)
+        start = end - len(digests)
+        Config._pending.clear()
+        Config._dirty = False
+        
+        # Pick up digests appended by other instances sharing CONFIG_DIR (e.g. a listener
+        # and a manual sync), reading the whole file if it was compacted or cleared meanwhile
+        uploaded.update(Config._iter_digests(Config._cache_size if Config._cache_size <= start else 0,
+                                             start))
+        Config._cache_size = end
+        if uploaded.bloom is not None:
+            Config._save_bloom_file(uploaded.bloom, end)
+    
+    @staticmethod
+    def clear_uploaded_qsos():
+        """Delete cache file and forget uploaded QSOs"""
+        Config.ensure_dir()
+        Config.CACHE_FILE.unlink(missing_ok=True)
+        Config.LEGACY_CACHE_FILE.unlink(missing_ok=True)
+        Config.BLOOM_FILE.unlink(missing_ok=True)
+        if Config._in_memory_cache is not None:
+            Config._in_memory_cache.clear()
+        Config._legacy_hashes.clear()
+        Config._pending.clear()
+        Config._dirty = False
+        Config._cache_size = 0
+
+
+atexit.register(Config.flush_cache)
+
+
+class QsoCache:
+    """Set-like store of uploaded QSO hashes
+    
+    With pybloom_live installed, membership is checked against a scalable bloom
+    filter (constant memory per QSO, 1e-6 false positive rate, so a new QSO is
+    very rarely skipped as duplicate). Otherwise hashes are kept in a set.
+    """
+    
+    def __init__(self, bloom=None):
+        if bloom is None and ScalableBloomFilter is not None:
+            bloom = ScalableBloomFilter(initial_capacity=10000, error_rate=1e-6)
+        self.bloom = bloom
+        self.exact: Set[bytes] = set()  # Only used without bloom filter
+    
+    def __contains__(self, qso_hash: bytes) -> bool:
+        if self.bloom is None:
+            return qso_hash in self.exact
+        return qso_hash in self.bloom
+    
+    def __len__(self) -> int:
+        return len(self.exact) if self.bloom is None else len(self.bloom)
+    
+    def add(self, qso_hash: bytes):
+        if self.bloom is None:
+            self.exact.add(qso_hash)
+            return
+        self.bloom.add(qso_hash)
+    
+    def update(self, qso_hashes: Iterable[bytes]):
+        for qso_hash in qso_hashes:
+            self.add(qso_hash)
+    
+    def clear(self):
+        self.__init__()
 
 
 class AdifParser:
     """Parse ADIF format QSO records"""
     
+    DIGEST_SIZE = 8  # Bytes of BLAKE2b digest used for duplicate detection
+    
     @staticmethod
-    def parse_line(line: str) -> Optional[Dict]:
-        """Parse single ADIF line into dictionary"""
-        record = {}
-        
-        # Match ADIF tags: <KEY:LENGTH>VALUE
-        pattern = r'<(\w+):(\d+)>([^<]*)'
-        matches = re.findall(pattern, line, re.IGNORECASE)
-        
-        if not matches:
-            return None
-        
-        for key, length, value in matches:
-            record[key.lower()] = value
+    def parse_line(line: bytes) -> Optional[Dict[bytes, bytes]]:
+        """Parse single ADIF line into dictionary (lowercase bytes keys, raw bytes values)"""
+        # A single C-level findall beats scanning tags with str.find in Python
+        record = {key.lower(): value for key, length, value in _ADIF_TAG_RE.findall(line)}
         
         # Validate essential fields
-        if 'call' not in record or 'qso_date' not in record or 'time_on' not in record:
+        if b'call' not in record or b'qso_date' not in record or b'time_on' not in record:
             return None
         
         return record
     
     @staticmethod
-    def calculate_hash(adif_line: str) -> str:
-        """Calculate SHA256 hash of ADIF record for duplicate detection"""
-        # Parse to normalize the record (remove whitespace differences)
-        record = AdifParser.parse_line(adif_line)
-        if not record:
-            return ""
-        
-        # Create normalized string for hashing (date + time + call + freq + mode)
-        normalized = f"{record.get('qso_date', '')}_{record.get('time_on', '')}_" \
-                    f"{record.get('call', '')}_{record.get('freq', '')}_{record.get('mode', '')}"
-        return hashlib.sha256(normalized.encode()).hexdigest()
+    def dedup_key(record: Dict[bytes, bytes]) -> Tuple[bytes, bytes, bytes, bytes, bytes]:
+        """Fields identifying a QSO (date + time + call + freq + mode)"""
+        return (record.get(b'qso_date', b''), record.get(b'time_on', b''), record.get(b'call', b''),
+                record.get(b'freq', b''), record.get(b'mode', b''))
+    
+    @staticmethod
+    def hash_from_record(record: Dict[bytes, bytes]) -> bytes:
+        """Calculate raw BLAKE2b digest of parsed ADIF record for duplicate detection"""
+        normalized = b'\x1f'.join(AdifParser.dedup_key(record))
+        return hashlib.blake2b(normalized, digest_size=AdifParser.DIGEST_SIZE).digest()
     
     @staticmethod
-    def read_file(filepath: str) -> List[str]:
-        """Read ADIF file, handling file locks with retries"""
+    def legacy_hash(record: Dict[bytes, bytes]) -> bytes:
+        """Calculate raw SHA256 digest the original version stored for parsed ADIF record"""
+        normalized = '_'.join(value.decode(errors='replace') for value in AdifParser.dedup_key(record))
+        return hashlib.sha256(normalized.encode()).digest()
+    
+    @staticmethod
+    def iter_lines(filepath: str) -> Iterator[bytes]:
+        """Stream stripped lines of ADIF file as bytes, handling file locks with retries"""
         max_retries = 5
         for attempt in range(max_retries):
+            last_attempt = attempt == max_retries - 1
+            
+            # Wait until the writer (e.g. WSJT-X appending a QSO) has stopped modifying the file
+            mtime = os.stat(filepath).st_mtime_ns
+            time.sleep(0.1)
+            if os.stat(filepath).st_mtime_ns != mtime and not last_attempt:
+                continue
+            
             try:
-                with open(filepath, 'r') as f:
-                    return f.readlines()
-            except IOError as e:
-                if attempt < max_retries - 1:
-                    time.sleep(0.5)  # File locked, retry
-                else:
-                    raise
+                f = open(filepath, 'rb', buffering=1 << 16)
+                break
+            except FileNotFoundError:
+                raise
+            except IOError:
+                if last_attempt:
+                    raise  # File still locked
+        
+        with f:
+            for line in f:
+                yield line.strip()
     
     @staticmethod
-    def read_new_records(filepath: str, last_upload_time: Optional[datetime] = None) -> List[str]:
+    def read_new_records(filepath: str, last_upload_time: Optional[datetime] = None) -> List[bytes]:
         """Read only new ADIF records from file (those after last upload)"""
+        new_records = []
         try:
-            lines = AdifParser.read_file(filepath)
+            for line in AdifParser.iter_lines(filepath):
+                if not line or line.startswith(b'#'):
+                    continue
+                
+                record = AdifParser.parse_line(line)
+                if not record:
+                    continue
+                
+                # If we're tracking by time, only include records after last upload
+                if last_upload_time:
+                    try:
+                        qso_date = record.get(b'qso_date', b'')
+                        time_on = record.get(b'time_on', b'')
+                        if qso_date and time_on:
+                            record_dt = datetime.strptime((qso_date + time_on).decode(), "%Y%m%d%H%M%S")
+                            if record_dt < last_upload_time:
+                                continue
+                    except:
+                        pass
+                
+                new_records.append(line)
         except IOError as e:
             return []
         
-        new_records = []
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            record = AdifParser.parse_line(line)
-            if not record:
-                continue
-            
-            # If we're tracking by time, only include records after last upload
-            if last_upload_time:
-                try:
-                    qso_date = record.get('qso_date', '')
-                    time_on = record.get('time_on', '')
-                    if qso_date and time_on:
-                        record_dt = datetime.strptime(f"{qso_date}{time_on}", "%Y%m%d%H%M%S")
-                        if record_dt < last_upload_time:
-                            continue
-                except:
-                    pass
-            
-            new_records.append(line)
-        
         return new_records
 
 
+if _adifparse is not None:
+    # Compiled equivalent of AdifParser.parse_line
+    AdifParser.parse_line = staticmethod(_adifparse.parse_line)
+
+
 class CloudlogPusher:
     """Push ADIF records to Cloudlog via HTTP API"""
     
+    MAX_WORKERS = 8  # Upload threads in push_file when httpx is not installed
+    MAX_IN_FLIGHT = 16  # Batches being uploaded concurrently by push_file
+    BATCH_SIZE = 200  # Records combined into one POST by push_file
+    PROBE_SIZE = 2  # Records of first POST checking whether Cloudlog imports batches
+    BATCH_TIMEOUT = 60
+    CONNECT_RETRIES = 3  # Attempts to re-establish a connection before a POST fails
+    JSON_HEADERS = {'Content-Type': 'application/json'}
+    AUTH_ERRORS = (401, 403)  # Bad or missing API key: abort push_file instead of bisecting
+    
     def __init__(self, config: Dict[str, str]):
         self.url = config['url']
         self.api_key = config['apikey']
         self.station_id = config['stationid']
         self.session = requests.Session()
+        self.session.headers['Connection'] = 'keep-alive'
+        # Only retry connection failures: once the body is sent, Cloudlog may already have
+        # imported the QSOs, and replaying a POST would log them twice
+        retry = Retry(
+            total=self.CONNECT_RETRIES,
+            connect=self.CONNECT_RETRIES,
+            read=0,
+            other=0,
+            status=0,
+            backoff_factor=0.25
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.endpoint = urljoin(self.url, '/index.php/api/qso')
+        
+        # Static part of every JSON payload, completed by _payload
+        self._payload_prefix = ('{"key":%s,"station_profile_id":%s,"type":"adif","string":' % (
+            json.dumps(self.api_key), json.dumps(self.station_id))).encode()
+        
+        # Open a connection (TCP + TLS) in the background so the first upload doesn't pay for it
+        threading.Thread(target=self._prewarm, daemon=True).start()
+    
+    def _prewarm(self):
+        """Issue HEAD request to Cloudlog to warm up connection pool"""
+        try:
+            self.session.head(self.url, timeout=5)
+        except RequestException:
+            pass
+    
+    def _payload(self, adif_line: bytes) -> bytes:
+        """Build JSON payload for ADIF string from pre-serialized prefix"""
+        return self._payload_prefix + _json_string(adif_line.decode('utf-8', errors='replace')) + b'}'
     
-    def push_record(self, adif_line: str, show_progress: bool = False) -> Tuple[bool, Optional[str]]:
-        """Push single ADIF record to Cloudlog"""
+    @staticmethod
+    def _result(response) -> Tuple[bool, Optional[str]]:
+        """Convert Cloudlog HTTP response (requests or httpx) to upload result"""
+        if response.status_code in (200, 201):
+            return True, None
+        return False, f"{response.status_code}: {response.text[:100]}"
+    
+    @staticmethod
+    def _batch_result(response, count: int) -> Tuple[bool, Optional[str], Optional[int]]:
+        """Convert Cloudlog response to batch upload result and HTTP status
+        
+        A batch only counts as uploaded if Cloudlog reports importing every record.
+        """
+        ok, error = CloudlogPusher._result(response)
+        if ok and count > 1:
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            if not isinstance(body, dict):
+                body = {}
+            imported = body.get('adif_count')
+            if imported != count or body.get('adif_errors'):
+                ok = False
+                error = f"{response.status_code}: Cloudlog confirmed {imported} of {count} QSOs"
+        return ok, error, response.status_code
+    
+    def push_record(self, adif_line: bytes, record: Optional[Dict[bytes, bytes]],
+                    show_progress: bool = False) -> Tuple[bool, Optional[str]]:
+        """Push single ADIF record (already parsed by AdifParser.parse_line) to Cloudlog"""
         
-        # Parse ADIF line
-        record = AdifParser.parse_line(adif_line)
         if not record:
             return False, "Invalid ADIF format"
         
-        call = record.get('call', 'UNKNOWN')
+        call = record.get(b'call', b'UNKNOWN').decode(errors='replace')
         if show_progress:
             print(f"  {call}... ", end='', flush=True)
         
         # Clean up TX power field (remove 'W' suffix)
-        if 'tx_pwr' in record:
-            record['tx_pwr'] = record['tx_pwr'].replace('W', '').strip()
-        
-        # Prepare JSON payload
-        payload = {
-            "key": self.api_key,
-            "station_profile_id": self.station_id,
-            "type": "adif",
-            "string": adif_line
-        }
+        if b'tx_pwr' in record:
+            record[b'tx_pwr'] = record[b'tx_pwr'].replace(b'W', b'').strip()
         
         try:
             response = self.session.post(
                 self.endpoint,
-                json=payload,
+                data=self._payload(adif_line),
+                headers=self.JSON_HEADERS,
                 timeout=10
             )
             
             if show_progress:
                 print(response.status_code)
             
-            if response.status_code in (200, 201):
-                return True, None
-            else:
-                return False, f"{response.status_code}: {response.text[:100]}"
+            return self._result(response)
         
         except RequestException as e:
             if show_progress:
                 print(f"ERROR: {e}")
             return False, str(e)
     
+    def push_batch(self, adif_lines: List[bytes]) -> Tuple[bool, Optional[str], Optional[int]]:
+        """Push several ADIF records to Cloudlog in a single POST (status None if not sent)"""
+        try:
+            response = self.session.post(
+                self.endpoint,
+                data=self._payload(b'\n'.join(adif_lines)),
+                headers=self.JSON_HEADERS,
+                timeout=self.BATCH_TIMEOUT
+            )
+            return self._batch_result(response, len(adif_lines))
+        except RequestException as e:
+            return False, str(e), None
+    
+    async def push_batch_async(self, client,
+                               adif_lines: List[bytes]) -> Tuple[bool, Optional[str], Optional[int]]:
+        """Push several ADIF records to Cloudlog in a single POST using httpx.AsyncClient"""
+        try:
+            response = await client.post(
+                self.endpoint,
+                content=self._payload(b'\n'.join(adif_lines)),
+                headers=self.JSON_HEADERS,
+                timeout=self.BATCH_TIMEOUT
+            )
+            return self._batch_result(response, len(adif_lines))
+        except httpx.HTTPError as e:
+            return False, str(e), None
+    
+    @asynccontextmanager
+    async def _uploader(self):
+        """Yield coroutine function uploading a batch of ADIF records
+        
+        Uses a multiplexed HTTP/2 httpx.AsyncClient when httpx is installed,
+        otherwise runs push_batch on a thread pool sharing self.session. Both retry
+        failed connection attempts (CONNECT_RETRIES) only.
+        """
+        if httpx is None:
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                async def upload(adif_lines: List[bytes]):
+                    return await loop.run_in_executor(executor, self.push_batch, adif_lines)
+                yield upload
+            return
+        
+        # httpx ignores proxy environment variables once a transport is given, so pass on
+        # the proxy requests would use for the endpoint (honouring no_proxy)
+        proxy = select_proxy(self.endpoint, get_environ_proxies(self.endpoint))
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=self.MAX_IN_FLIGHT),
+            retries=self.CONNECT_RETRIES,
+            proxy=proxy
+        )
+        async with httpx.AsyncClient(transport=transport, timeout=10) as client:
+            async def upload(adif_lines: List[bytes]):
+                return await self.push_batch_async(client, adif_lines)
+            yield upload
+    
     def push_file(self, filepath: str, show_progress: bool = True, skip_duplicates: bool = True) -> Dict:
         """Push ADIF file to Cloudlog with duplicate detection"""
+        return asyncio.run(self.push_file_async(filepath, show_progress, skip_duplicates))
+    
+    async def push_file_async(self, filepath: str, show_progress: bool = True,
+                              skip_duplicates: bool = True) -> Dict:
+        """Push ADIF file to Cloudlog with duplicate detection, uploading batches concurrently"""
         
         if show_progress:
             print(f"\nReading {filepath}...")
         
+        # Parse whole file and drop duplicates before any HTTP traffic
+        pending = []  # (idx, line, record, hash)
+        seen = set()  # QSOs repeated within this file
+        skipped = 0
         try:
-            lines = AdifParser.read_file(filepath)
+            for idx, trimmed in enumerate(AdifParser.iter_lines(filepath), 1):
+                if not trimmed or trimmed.startswith(b"#"):
+                    continue
+                
+                record = AdifParser.parse_line(trimmed)
+                if not record:
+                    continue
+                
+                # Check for duplicate
+                qso_hash = AdifParser.hash_from_record(record)
+                if qso_hash in seen or (skip_duplicates and Config.is_uploaded(qso_hash, record)):
+                    skipped += 1
+                    continue
+                if skip_duplicates:
+                    seen.add(qso_hash)
+                
+                pending.append((idx, trimmed, record, qso_hash))
         except IOError as e:
             print(f"✗ Cannot read file: {e}")
             return {"success": 0, "failed": 0, "skipped": 0}
         
         if show_progress:
+            print(f"Found {len(pending)} new QSOs ({skipped} duplicates)")
             print(f"POSTing to {self.endpoint}")
         
-        # Load previously uploaded QSOs
-        uploaded_hashes = Config.load_uploaded_qsos() if skip_duplicates else set()
-        
         success = 0
         failed = 0
-        skipped = 0
         errors = []
+        batching = True  # Cleared if Cloudlog turns out not to import multi-record payloads
+        auth_error = None  # Set once Cloudlog rejects the API key, failing all remaining batches
+        semaphore = asyncio.Semaphore(self.MAX_IN_FLIGHT)
         
-        for idx, line in enumerate(lines, 1):
-            trimmed = line.strip()
-            if not trimmed or trimmed.startswith("#"):
-                continue
+        async with self._uploader() as upload:
             
-            # Check for duplicate
-            qso_hash = AdifParser.calculate_hash(trimmed)
-            if qso_hash and qso_hash in uploaded_hashes:
-                skipped += 1
-                continue
+            async def push_each(batch: List[Tuple[int, bytes, Dict, bytes]]) -> bool:
+                """Upload records of batch one per POST"""
+                results = await asyncio.gather(*(push([item]) for item in batch))
+                return all(results)
             
-            result = self.push_record(trimmed, show_progress)
+            async def push(batch: List[Tuple[int, bytes, Dict, bytes]], probe: bool = False) -> bool:
+                """Upload batch of (idx, line, record, hash), bisecting batches Cloudlog rejects"""
+                nonlocal success, failed, batching, auth_error
+                if len(batch) > 1 and not batching:
+                    return await push_each(batch)
+                
+                async with semaphore:
+                    if auth_error:
+                        failed += len(batch)
+                        return False
+                    ok, error, status_code = await upload([item[1] for item in batch])
+                
+                if status_code in self.AUTH_ERRORS:
+                    # Applies to every record, so report it once and stop uploading
+                    if not auth_error:
+                        auth_error = error
+                        errors.append((0, f"  {error} (check API key, upload aborted)"))
+                    failed += len(batch)
+                    return False
+                
+                # Connection errors and 5xx fail the whole batch, retrying would only add load
+                if not ok and len(batch) > 1 and status_code is not None and status_code < 500:
+                    if status_code < 400:
+                        # Accepted without confirming every record: resend them one per POST
+                        # (Cloudlog may log some twice, but none are lost) and stop batching
+                        batching = False
+                        return await push_each(batch)
+                    if probe:
+                        # Rejected probe: batching is unsupported if every record uploads alone
+                        batching = not await push_each(batch)
+                        return not batching
+                    # Bisect to isolate bad records
+                    mid = len(batch) // 2
+                    results = await asyncio.gather(push(batch[:mid]), push(batch[mid:]))
+                    return all(results)
+                
+                for idx, _, record, qso_hash in batch:
+                    if show_progress:
+                        status = "✓" if ok else f"✗ {error}"
+                        call = record.get(b'call', b'UNKNOWN').decode(errors='replace')
+                        print(f"  {call}... {status}")
+                    
+                    if ok:
+                        success += 1
+                        Config.save_uploaded_qso(qso_hash)
+                    else:
+                        failed += 1
+                        errors.append((idx, f"  Line {idx}: {error}"))
+                return ok
             
-            if result[0]:
-                success += 1
-                if qso_hash:
-                    Config.save_uploaded_qso(qso_hash)
-            else:
-                failed += 1
-                errors.append(f"  Line {idx}: {result[1]}")
+            # Check with a small batch that Cloudlog imports batches before sending the rest
+            if pending:
+                await push(pending[:self.PROBE_SIZE], probe=True)
+            rest = pending[self.PROBE_SIZE:]
+            await asyncio.gather(*(push(rest[i:i + self.BATCH_SIZE])
+                                   for i in range(0, len(rest), self.BATCH_SIZE)))
+        
+        Config.flush_cache()
+        errors = [error for _, error in sorted(errors)]
         
         if show_progress:
             print(f"\n✓ {success} successful, ✗ {failed} failed, ⊘ {skipped} skipped (duplicates)")
@@ -292,15 +765,24 @@ class WsjtxListener:
     MULTICAST_GROUP = '239.255.0.1'
     MULTICAST_PORT = 2237
     
+    # WSJT-X UDP protocol (QDataStream, big-endian): magic, schema, message type
+    WSJTX_MAGIC = 0xADBCCBDA
+    WSJTX_HEADER = struct.Struct('>III')
+    MSG_LOGGED_ADIF = 12
+    
+    RECEIVE_BUFFER_SIZE = 1 << 20  # Absorb bursts while uploads are in progress
+    
     def __init__(self, pusher: CloudlogPusher):
         self.pusher = pusher
         self.socket = None
-        self.last_uploaded_qsos: Set[str] = Config.load_uploaded_qsos()
+        Config.load_uploaded_qsos()  # Read cache now rather than when the first QSO arrives
+        self.uploads: queue.Queue = queue.Queue()  # (adif_line, record), None to stop
     
     def start(self):
         """Start listening for WSJT-X messages"""
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RECEIVE_BUFFER_SIZE)
         
         # Bind to multicast port
         self.socket.bind(('', self.MULTICAST_PORT))
@@ -312,6 +794,10 @@ class WsjtxListener:
         print(f"✓ Listening on {self.MULTICAST_GROUP}:{self.MULTICAST_PORT}")
         print("  Waiting for WSJT-X QSOs... (Ctrl+C to exit)\n")
         
+        # Upload from a separate thread so receiving never blocks on Cloudlog
+        worker = threading.Thread(target=self._upload_worker, daemon=True)
+        worker.start()
+        
         try:
             while True:
                 data, addr = self.socket.recvfrom(65535)
@@ -320,45 +806,86 @@ class WsjtxListener:
             print("\n✓ Shutting down...")
         finally:
             self.socket.close()
+            self.uploads.put(None)
+            worker.join()
+            Config.flush_cache()
+    
+    @staticmethod
+    def _read_utf8(data: bytes, offset: int) -> Tuple[Optional[bytes], int]:
+        """Read QDataStream utf8 field (u32 length prefix), returning value and next offset"""
+        (length,) = struct.unpack_from('>I', data, offset)
+        offset += 4
+        if length == 0xFFFFFFFF:
+            return None, offset  # Null string
+        return data[offset:offset + length], offset + length
+    
+    def _extract_adif(self, data: bytes) -> Optional[bytes]:
+        """Extract ADIF record from WSJT-X UDP message"""
+        if len(data) >= self.WSJTX_HEADER.size:
+            magic, schema, msg_type = self.WSJTX_HEADER.unpack_from(data)
+            if magic == self.WSJTX_MAGIC:
+                # Only Logged ADIF messages carry a QSO (Id, then ADIF text)
+                if msg_type != self.MSG_LOGGED_ADIF:
+                    return None
+                _, offset = self._read_utf8(data, self.WSJTX_HEADER.size)
+                adif, _ = self._read_utf8(data, offset)
+                if not adif:
+                    return None
+                # Skip ADIF header (<adif_ver:...> ... <EOH>)
+                eoh = adif.lower().find(b'<eoh>')
+                return adif[eoh + len(b'<eoh>'):].strip() if eoh != -1 else adif.strip()
+        
+        # Not a WSJT-X message (e.g. other logging software): search for ADIF patterns
+        start = data.find(b'<QSO_DATE:')
+        if start == -1 or b'<CALL:' not in data:
+            return None
+        
+        end = data.find(b'<EOR>', start)
+        if end == -1:
+            return None
+        
+        return data[start:end + len(b'<EOR>')]
     
     def _parse_message(self, data: bytes):
         """Parse WSJT-X UDP message and extract ADIF if present"""
         try:
-            # Look for ADIF patterns
-            text_data = data.decode('utf-8', errors='ignore')
-            if '<QSO_DATE:' not in text_data or '<CALL:' not in text_data:
-                return
-            
-            # Extract ADIF record
-            adif_match = re.search(r'<QSO_DATE:\d+>\d+.*?<EOR>', text_data)
-            if not adif_match:
+            adif_line = self._extract_adif(data)
+            if not adif_line:
                 return
             
-            adif_line = adif_match.group(0)
-            
-            # Check for duplicate
-            qso_hash = AdifParser.calculate_hash(adif_line)
-            if qso_hash in self.last_uploaded_qsos:
-                return  # Skip duplicate
-            
-            # Parse and push
             record = AdifParser.parse_line(adif_line)
             if not record:
                 return
             
-            result = self.pusher.push_record(adif_line, show_progress=False)
-            
-            if result[0]:
-                call = record.get('call', 'UNKNOWN')
-                print(f"✓ Uploaded QSO with {call}")
-                if qso_hash:
-                    Config.save_uploaded_qso(qso_hash)
-                    self.last_uploaded_qsos.add(qso_hash)
-            else:
-                print(f"✗ Error uploading: {result[1]}")
+            self.uploads.put((adif_line, record))
         
         except Exception as e:
             pass  # Silently skip malformed messages
+    
+    def _upload_worker(self):
+        """Push queued QSOs to Cloudlog until None is queued"""
+        while (item := self.uploads.get()) is not None:
+            try:
+                self._upload(*item)
+            except Exception as e:
+                # Keep the worker alive (e.g. cache write failing on a full disk)
+                print(f"✗ Error processing QSO: {e}")
+    
+    def _upload(self, adif_line: bytes, record: Dict[bytes, bytes]):
+        """Push QSO to Cloudlog unless already uploaded"""
+        # Check for duplicate
+        qso_hash = AdifParser.hash_from_record(record)
+        if Config.is_uploaded(qso_hash, record):
+            return  # Skip duplicate
+        
+        result = self.pusher.push_record(adif_line, record, show_progress=False)
+        
+        if result[0]:
+            call = record.get(b'call', b'UNKNOWN').decode(errors='replace')
+            print(f"✓ Uploaded QSO with {call}")
+            Config.save_uploaded_qso(qso_hash)
+        else:
+            print(f"✗ Error uploading: {result[1]}")
 
 
 def configure_interactive():
@@ -409,6 +936,9 @@ def show_menu(wsjtx_log_path: Path):
 def main():
     """Main entry point with menu system"""
     
+    # Exit normally on SIGTERM so atexit handlers flush the duplicate cache
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
     # Check for command-line arguments (backward compatibility)
     if '--configure' in sys.argv or '-c' in sys.argv:
         configure_interactive()
@@ -472,8 +1002,7 @@ def main():
         
         elif choice == '5':
             # Clear cache
-            Config.ensure_dir()
-            Config.CACHE_FILE.unlink(missing_ok=True)
+            Config.clear_uploaded_qsos()
             print("✓ Duplicate cache cleared")
             time.sleep(1)
         